@@ -28,13 +28,15 @@ Dependencies: python-docx (pip install python-docx)
 import re
 import sys
 import os
+import io
+import copy
+import functools
+import stat
+import traceback
 from pathlib import Path
 
-from docx import Document
-from docx.shared import Inches, Pt, Twips, Emu
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.oxml.ns import qn, nsdecls
-from docx.oxml import OxmlElement, parse_xml
+# python-docx is imported lazily by _load_docx() so that parsing and the
+# file-not-found exit don't pay for its import chain.
 
 
 # ============================================================================
@@ -50,12 +52,8 @@ PAGE_H_TWIPS = 15840       # 11"
 MARGIN_TOP_TWIPS = 1080    # 0.75"
 MARGIN_BOTTOM_TWIPS = 1440 # 1"
 MARGIN_LR_TWIPS = 893      # 44.65pt (template exact)
-# Keep EMU versions for python-docx API calls
-PAGE_W = Inches(8.5)
-PAGE_H = Inches(11)
-MARGIN_TOP = Inches(0.75)
-MARGIN_BOTTOM = Inches(1.0)
-MARGIN_LR = Emu(MARGIN_LR_TWIPS * 914)  # twips -> EMU (1 twip = 914.4 EMU)
+# EMU versions for python-docx API calls (computed by _load_docx)
+PAGE_W = PAGE_H = MARGIN_TOP = MARGIN_BOTTOM = MARGIN_LR = None
 
 # Font sizes
 TITLE_PT = 24
@@ -84,176 +82,295 @@ REF_INDENT_TWIPS = 354          # 17.70pt (template: references hanging indent)
 # Markdown Parser
 # ============================================================================
 
+# Line patterns, compiled once; parse_markdown only reaches them after a
+# matching prefix check
+_RE_NAMED_HDR = re.compile(r"^##\s+(References|Abstract|Keywords)", re.IGNORECASE)
+_RE_REF_ITEM = re.compile(r"^\[(\d+)\]\s*(.*)")
+_RE_REF_LEAD = re.compile(r"^\[\d+\]")
+# **Name** starts an author, *line* is an affiliation; bold is tried first
+_RE_AUTHOR = re.compile(r"^(?:\*\*(?P<bold>.+?)\*\*|\*(?P<italic>.+?)\*)\s*$")
+
+# Parser states (ints: compared on every line)
+_ST_FRONT, _ST_POST_TITLE, _ST_ABSTRACT, _ST_KEYWORDS, _ST_BODY = range(5)
+
+
+class Author:
+    """One author: name plus affiliation/contact lines."""
+    __slots__ = ("name", "lines")
+
+    def __init__(self, name, lines=None):
+        self.name = name
+        self.lines = [] if lines is None else lines
+
+    def __eq__(self, other):
+        return (isinstance(other, Author)
+                and (self.name, self.lines) == (other.name, other.lines))
+
+    def __repr__(self):
+        return f"Author(name={self.name!r}, lines={self.lines!r})"
+
+
+class Section:
+    """
+    A numbered heading (level 1 = ##, level 2 = ###) and its content:
+    paragraph strings and ("equation", text) tuples.
+    """
+    __slots__ = ("level", "heading", "number", "content")
+
+    def __init__(self, level, heading, number, content=None):
+        self.level = level
+        self.heading = heading
+        self.number = number
+        self.content = [] if content is None else content
+
+    def __eq__(self, other):
+        return (isinstance(other, Section)
+                and (self.level, self.heading, self.number, self.content)
+                == (other.level, other.heading, other.number, other.content))
+
+    def __repr__(self):
+        return (f"Section(level={self.level!r}, heading={self.heading!r}, "
+                f"number={self.number!r}, content={self.content!r})")
+
+
 def parse_markdown(filepath):
     """Parse IEEE-structured markdown into a dict."""
+    # Stream the file: only one line of lookahead is ever needed
     with open(filepath, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+        return _parse_lines(f)
 
+
+def parse_markdown_str(text):
+    """Parse IEEE-structured markdown already read into a string."""
+    # Split on "\n" only, like iterating a text-mode file (str.splitlines
+    # would also break on form feeds, U+2028 and friends)
+    return _parse_lines(text.split("\n"))
+
+
+def _parse_lines(lines):
+    """Parse an iterable of markdown lines (newlines optional) into a dict."""
     result = {
         "title": "",
-        "authors": [],       # list of {"name": str, "lines": [str, ...]}
+        "authors": [],       # list of Author
         "abstract": [],
         "keywords": "",
-        "sections": [],
-        "references": [],
+        "sections": [],      # list of Section
+        "references": [],    # markdown already stripped
     }
 
-    state = "front"
+    state = _ST_FRONT
     in_references = False
     current_section = None
     h1_count = 0
     h2_count = 0
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].rstrip("\n")
+    lines = iter(lines)
+    pending = None  # line read ahead by the reference collector
+
+    while True:
+        if pending is not None:
+            line, pending = pending, None
+        else:
+            line = next(lines, None)
+            if line is None:
+                break
+
+        # Blank lines never produce output or change state; skip them
+        # before paying for a strip()
+        if not line or line.isspace():
+            continue
         trimmed = line.strip()
-        i += 1
+
+        # Every construct is identified by its first few characters, so the
+        # line is classified once here and each regex below is only tried
+        # once a cheap prefix test has passed.
+        is_hr = (len(trimmed) >= 3 and trimmed[0] == "-"
+                 and trimmed.count("-") == len(trimmed))
+        is_h2_any = trimmed.startswith("##") and trimmed[2:3].isspace()
+        is_heading = trimmed.startswith(("## ", "### "))
+
+        # Named front/back-matter headers: "references", "abstract",
+        # "keywords" or None
+        named = None
+        if is_h2_any:
+            hdr_match = _RE_NAMED_HDR.match(trimmed)
+            if hdr_match:
+                named = hdr_match.group(1).lower()
 
         # References
-        if re.match(r"^##\s+References", trimmed, re.IGNORECASE) or trimmed == "REFERENCES":
+        if named == "references" or trimmed == "REFERENCES":
             in_references = True
             current_section = None
             continue
 
         if in_references:
-            ref_match = re.match(r"^\[(\d+)\]\s*(.*)", trimmed)
+            ref_match = trimmed.startswith("[") and _RE_REF_ITEM.match(trimmed)
             if ref_match:
-                ref_text = ref_match.group(2)
-                # Collect continuation lines
-                while i < len(lines) and lines[i].strip() and not re.match(r"^\[\d+\]", lines[i].strip()):
-                    ref_text += " " + lines[i].strip()
-                    i += 1
-                result["references"].append(ref_text)
+                parts = [ref_match.group(2)]
+                # Collect continuation lines; the first line that isn't one
+                # goes back to the main loop
+                for next_line in lines:
+                    nxt = next_line.strip()
+                    if not nxt or (nxt.startswith("[") and _RE_REF_LEAD.match(nxt)):
+                        pending = next_line
+                        break
+                    parts.append(nxt)
+                # References are plain text runs in the document, so their
+                # markdown is stripped here rather than in build_document
+                result["references"].append(strip_markdown(" ".join(parts)))
             continue
 
         # Title (H1)
-        if line.startswith("# ") and state == "front":
+        if line.startswith("# ") and state == _ST_FRONT:
             result["title"] = line[2:].strip()
-            state = "post_title"
+            state = _ST_POST_TITLE
             continue
 
         # Author/affiliation after title
         # Each **Name** starts a new author; *italic* lines are affiliation info
         # This block continues until ## Abstract (case-insensitive) is reached.
-        # Horizontal rules (---) and blank lines are ignored here.
-        if state == "post_title":
-            if re.match(r"^---+$", trimmed):
-                continue
-            if trimmed == "":
-                continue
-            bold_match = re.match(r"^\*\*(.+?)\*\*\s*$", trimmed)
-            if bold_match:
-                result["authors"].append({
-                    "name": bold_match.group(1).strip(),
-                    "lines": [],
-                })
-                continue
-            italic_match = re.match(r"^\*(.+?)\*\s*$", trimmed)
-            if italic_match and result["authors"]:
-                result["authors"][-1]["lines"].append(
-                    italic_match.group(1).strip()
-                )
+        # Horizontal rules (---) are ignored here; blank lines never get this far.
+        if state == _ST_POST_TITLE:
+            if is_hr:
                 continue
+            author_match = trimmed.startswith("*") and _RE_AUTHOR.match(trimmed)
+            if author_match:
+                if author_match.group("bold") is not None:
+                    result["authors"].append(
+                        Author(author_match.group("bold").strip())
+                    )
+                    continue
+                if result["authors"]:
+                    result["authors"][-1].lines.append(
+                        author_match.group("italic").strip()
+                    )
+                    continue
             # Non-matching lines: fall through to abstract/heading checks below
 
         # Abstract (case-insensitive)
-        if re.match(r"^##\s+Abstract", trimmed, re.IGNORECASE):
-            state = "abstract"
+        if named == "abstract":
+            state = _ST_ABSTRACT
             current_section = None
             continue
 
-        if state == "abstract":
-            if trimmed == "" or re.match(r"^---+$", trimmed):
+        if state == _ST_ABSTRACT:
+            if is_hr:
                 continue
-            if re.match(r"^##\s", trimmed):
-                state = "body"
+            if is_h2_any:
+                state = _ST_BODY
                 # fall through to heading parse
             else:
                 result["abstract"].append(trimmed)
                 continue
 
         # Keywords
-        if re.match(r"^##\s+Keywords", trimmed, re.IGNORECASE):
-            state = "keywords"
+        if named == "keywords":
+            state = _ST_KEYWORDS
             current_section = None
             continue
 
-        if state == "keywords":
-            if trimmed == "" or re.match(r"^---+$", trimmed):
+        if state == _ST_KEYWORDS:
+            if is_hr:
                 continue
-            if re.match(r"^##\s", trimmed):
-                state = "body"
+            if is_h2_any:
+                state = _ST_BODY
                 # fall through
             else:
                 result["keywords"] = strip_markdown(trimmed)
                 continue
 
         # Skip horizontal rules in body (visual separators, no output)
-        if re.match(r"^---+$", trimmed):
-            continue
-
-        # H2 section heading
-        if re.match(r"^## ", trimmed):
-            state = "body"
-            heading = trimmed[3:].strip()
-            h1_count += 1
-            h2_count = 0
-            current_section = {
-                "level": 1,
-                "heading": heading,
-                "number": h1_count,
-                "content": [],
-            }
-            result["sections"].append(current_section)
+        if is_hr:
             continue
 
-        # H3 subsection heading
-        if re.match(r"^### ", trimmed):
-            heading = trimmed[4:].strip()
-            h2_count += 1
-            current_section = {
-                "level": 2,
-                "heading": heading,
-                "number": h2_count,
-                "content": [],
-            }
+        # H2 section heading (level 1) or H3 subsection heading (level 2)
+        if is_heading:
+            level = 1 if trimmed[2] == " " else 2
+            if level == 1:
+                state = _ST_BODY
+                h1_count += 1
+                h2_count = 0
+                number = h1_count
+            else:
+                h2_count += 1
+                number = h2_count
+            current_section = Section(level, trimmed[level + 2:].strip(), number)
             result["sections"].append(current_section)
             continue
 
         # Body text
-        if current_section is not None and state == "body":
-            if trimmed:
-                # Detect display equation: $$...$$
-                eq_match = re.match(r"^\$\$(.+?)\$\$$", trimmed)
-                if eq_match:
-                    current_section["content"].append(("equation", eq_match.group(1)))
-                else:
-                    current_section["content"].append(trimmed)
+        if current_section is not None and state == _ST_BODY:
+            # Detect display equation: $$...$$ with a non-empty body
+            # (4 delimiter chars + at least 1), no regex needed
+            if (len(trimmed) >= 5 and trimmed.startswith("$$")
+                    and trimmed.endswith("$$")):
+                current_section.content.append(("equation", trimmed[2:-2]))
+            else:
+                current_section.content.append(trimmed)
 
     return result
 
 
+def _unwrap_marker(text, marker):
+    """
+    Drop paired `marker` delimiters, keeping the text between them.
+    Equivalent to re.sub(marker + "(.+?)" + marker, r"\1", text): the closing
+    marker is the nearest one after at least one character, and a pair never
+    spans a newline.
+    """
+    n = len(marker)
+    out = []
+    pos = 0
+    start = text.find(marker)
+    while start != -1:
+        end = text.find(marker, start + n + 1)
+        if end == -1:
+            break
+        if "\n" in text[start + n:end]:
+            start = text.find(marker, start + 1)
+            continue
+        out.append(text[pos:start])
+        out.append(text[start + n:end])
+        pos = end + n
+        start = text.find(marker, pos)
+    if not out:
+        return text
+    out.append(text[pos:])
+    return "".join(out)
+
+
 def strip_markdown(text):
-    """Remove **bold** and *italic* markers."""
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"`(.+?)`", r"\1", text)
+    """Remove **bold**, *italic* and `code` markers."""
+    # Order matters: bold pairs must be consumed before single-star italics
+    if "*" in text:
+        text = _unwrap_marker(text, "**")
+        text = _unwrap_marker(text, "*")
+    if "`" in text:
+        text = _unwrap_marker(text, "`")
     return text
 
 
-def to_roman(n):
+def _to_roman(n):
     vals = [(1000,"M"),(900,"CM"),(500,"D"),(400,"CD"),
             (100,"C"),(90,"XC"),(50,"L"),(40,"XL"),
             (10,"X"),(9,"IX"),(5,"V"),(4,"IV"),(1,"I")]
     result = ""
+    n = max(n, 0)  # divmod would wrap negatives; they have no numeral
     for v, s in vals:
-        while n >= v:
-            result += s
-            n -= v
+        q, n = divmod(n, v)
+        result += s * q
     return result
 
 
+# Section numbers are small, so precompute them; larger values fall back
+_ROMAN = [_to_roman(n) for n in range(128)]
+
+
+def to_roman(n):
+    if 0 <= n < len(_ROMAN):
+        return _ROMAN[n]
+    return _to_roman(n)
+
+
 def to_letter(n):
     return chr(64 + n)  # A=1, B=2
 
@@ -262,23 +379,88 @@ def to_letter(n):
 # Document Builder
 # ============================================================================
 
-def make_run(text, size=BODY_PT, bold=False, italic=False, small_caps=False,
-             subscript=False, superscript=False, font=FONT):
-    """Create a configured run element."""
-    run = OxmlElement("w:r")
+# Clark-notation names, i.e. what qn("w:val") etc. return, computed once.
+# Spelled out here rather than via qn() because python-docx loads lazily.
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_XML_NS = "{http://www.w3.org/XML/1998/namespace}"
+_Q_AFTER = _W_NS + "after"
+_Q_ASCII = _W_NS + "ascii"
+_Q_BEFORE = _W_NS + "before"
+_Q_BR = _W_NS + "br"
+_Q_CS = _W_NS + "cs"
+_Q_FIRST_LINE = _W_NS + "firstLine"
+_Q_HANSI = _W_NS + "hAnsi"
+_Q_HANGING = _W_NS + "hanging"
+_Q_IND = _W_NS + "ind"
+_Q_JC = _W_NS + "jc"
+_Q_KEEP_NEXT = _W_NS + "keepNext"
+_Q_LEFT = _W_NS + "left"
+_Q_LINE = _W_NS + "line"
+_Q_LINE_RULE = _W_NS + "lineRule"
+_Q_P = _W_NS + "p"
+_Q_PPR = _W_NS + "pPr"
+_Q_PERCENT = _W_NS + "percent"
+_Q_POS = _W_NS + "pos"
+_Q_SECTPR = _W_NS + "sectPr"
+_Q_SPACING = _W_NS + "spacing"
+_Q_T = _W_NS + "t"
+_Q_TAB = _W_NS + "tab"
+_Q_TABS = _W_NS + "tabs"
+_Q_VAL = _W_NS + "val"
+_Q_ZOOM = _W_NS + "zoom"
+_Q_XML_SPACE = _XML_NS + "space"
+
+
+def _load_docx():
+    """
+    Import python-docx into module globals on first use.
+    Everything below this point depends on it; the parser above does not.
+    Idempotent and cheap once loaded, so the public builders (make_run,
+    make_paragraph, set_final_section_two_col, ...) call it on entry.
+    """
+    global Document, Inches, Pt, Emu
+    global WD_ALIGN_PARAGRAPH
+    global OxmlElement, parse_xml, SubElement
+    global PAGE_W, PAGE_H, MARGIN_TOP, MARGIN_BOTTOM, MARGIN_LR
+
+    if PAGE_W is not None:
+        return
+
+    from docx import Document
+    from docx.shared import Inches, Pt, Emu
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import OxmlElement, parse_xml
+    from lxml.etree import SubElement  # plain leaves skip OxmlElement's lookup
+
+    MARGIN_LR = Emu(MARGIN_LR_TWIPS * 914)  # twips -> EMU (1 twip = 914.4 EMU)
+    MARGIN_TOP = Inches(0.75)
+    MARGIN_BOTTOM = Inches(1.0)
+    PAGE_H = Inches(11)
+    for shape in _RUN_SHAPES:
+        _rpr_template(*shape, False, False, FONT)
+    PAGE_W = Inches(8.5)  # assigned last: marks the import as complete
+
+
+@functools.lru_cache(maxsize=None)
+def _rpr_template(size, bold, italic, small_caps, subscript, superscript, font):
+    """
+    Build the w:rPr for one combination of run properties.
+    A document only uses a handful of combinations, so each is built once
+    and make_run deep-copies it.
+    """
     rPr = OxmlElement("w:rPr")
 
     rFonts = OxmlElement("w:rFonts")
-    rFonts.set(qn("w:ascii"), font)
-    rFonts.set(qn("w:hAnsi"), font)
-    rFonts.set(qn("w:cs"), font)
+    rFonts.set(_Q_ASCII, font)
+    rFonts.set(_Q_HANSI, font)
+    rFonts.set(_Q_CS, font)
     rPr.append(rFonts)
 
     sz = OxmlElement("w:sz")
-    sz.set(qn("w:val"), str(size * 2))  # half-points
+    sz.set(_Q_VAL, str(size * 2))  # half-points
     rPr.append(sz)
     szCs = OxmlElement("w:szCs")
-    szCs.set(qn("w:val"), str(size * 2))
+    szCs.set(_Q_VAL, str(size * 2))
     rPr.append(szCs)
 
     if bold:
@@ -291,23 +473,77 @@ def make_run(text, size=BODY_PT, bold=False, italic=False, small_caps=False,
         rPr.append(OxmlElement("w:smallCaps"))
     if subscript:
         vertAlign = OxmlElement("w:vertAlign")
-        vertAlign.set(qn("w:val"), "subscript")
+        vertAlign.set(_Q_VAL, "subscript")
         rPr.append(vertAlign)
     if superscript:
         vertAlign = OxmlElement("w:vertAlign")
-        vertAlign.set(qn("w:val"), "superscript")
+        vertAlign.set(_Q_VAL, "superscript")
         rPr.append(vertAlign)
 
-    run.append(rPr)
+    return rPr
+
+
+# Every (size, bold, italic, small_caps) run shape build_document emits in
+# the default font. _load_docx builds their rPr up front in _rpr_template's
+# cache, so the build itself never constructs one.
+_SHAPE_TITLE = (TITLE_PT, False, False, False)
+_SHAPE_AUTHOR = (AUTHOR_PT, False, False, False)
+_SHAPE_AUTHOR_AFFIL = (AUTHOR_AFFIL_PT, False, False, False)
+_SHAPE_AUTHOR_AFFIL_ITALIC = (AUTHOR_AFFIL_PT, False, True, False)
+_SHAPE_AFFIL_ITALIC = (AFFIL_PT, False, True, False)
+_SHAPE_ABSTRACT_BOLD = (ABSTRACT_PT, True, False, False)
+_SHAPE_ABSTRACT_BOLD_ITALIC = (ABSTRACT_PT, True, True, False)
+_SHAPE_KEYWORDS_BOLD_ITALIC = (KEYWORDS_PT, True, True, False)
+_SHAPE_H1_SMALLCAPS = (H1_PT, False, False, True)
+_SHAPE_H2_ITALIC = (H2_PT, False, True, False)
+_SHAPE_BODY = (BODY_PT, False, False, False)
+_SHAPE_BODY_BOLD = (BODY_PT, True, False, False)
+_SHAPE_BODY_ITALIC = (BODY_PT, False, True, False)
+_SHAPE_REF = (REF_PT, False, False, False)
+_RUN_SHAPES = (
+    _SHAPE_TITLE, _SHAPE_AUTHOR, _SHAPE_AUTHOR_AFFIL, _SHAPE_AUTHOR_AFFIL_ITALIC,
+    _SHAPE_AFFIL_ITALIC, _SHAPE_ABSTRACT_BOLD, _SHAPE_ABSTRACT_BOLD_ITALIC,
+    _SHAPE_KEYWORDS_BOLD_ITALIC, _SHAPE_H1_SMALLCAPS, _SHAPE_H2_ITALIC,
+    _SHAPE_BODY, _SHAPE_BODY_BOLD, _SHAPE_BODY_ITALIC, _SHAPE_REF,
+)
 
-    t = OxmlElement("w:t")
-    t.set(qn("xml:space"), "preserve")
+
+def make_run(text, size=BODY_PT, bold=False, italic=False, small_caps=False,
+             subscript=False, superscript=False, font=FONT):
+    """Create a configured run element."""
+    _load_docx()
+    run = OxmlElement("w:r")
+    run.append(copy.deepcopy(_rpr_template(
+        size, bold, italic, small_caps, subscript, superscript, font
+    )))
+
+    t = SubElement(run, _Q_T)
+    t.set(_Q_XML_SPACE, "preserve")
     t.text = text
-    run.append(t)
+    return run
+
+
+def _make_tab_run():
+    """Create a run holding a single tab character."""
+    run = OxmlElement("w:r")
+    SubElement(run, _Q_TAB)
+    return run
+
+
+def _make_break_run(size):
+    """Create a run holding a soft line break at the given size."""
+    run = OxmlElement("w:r")
+    run.append(copy.deepcopy(_rpr_template(
+        size, False, False, False, False, False, FONT
+    )))
+    SubElement(run, _Q_BR)
     return run
 
 
 NBSP = "\u00A0"  # non-breaking space
+_EM_DASH = "\u2014"
+_KEYWORDS_HEAD = "Keywords" + _EM_DASH
+_NBSP_TRANS = str.maketrans({" ": NBSP})  # spaces -> NBSP in math
 
 # LaTeX command -> Unicode glyph map
 LATEX_GLYPHS = {
@@ -360,15 +596,48 @@ LATEX_GLYPHS = {
 }
 
 # Math function names rendered as upright text (no glyph, just the name)
-LATEX_FUNCTIONS = {
+LATEX_FUNCTIONS = frozenset({
     "\\tanh", "\\cosh", "\\sinh", "\\sin", "\\cos", "\\tan",
     "\\log", "\\ln", "\\exp", "\\lim", "\\max", "\\min",
     "\\sup", "\\inf", "\\det", "\\dim", "\\ker", "\\arg",
     "\\deg", "\\gcd", "\\hom", "\\sec", "\\csc", "\\cot",
     "\\arcsin", "\\arccos", "\\arctan",
-}
-
-
+})
+
+# LaTeX patterns, compiled once (resolve_latex runs per paragraph)
+# A run of doubled backslashes before a command (markdown escaping) -> one
+_RE_DBL_BS = re.compile(r'\\\\+(?=[a-zA-Z])')
+# $...$ but not $$...$$ (negative lookbehind/lookahead for $)
+_RE_INLINE_MATH = re.compile(r'(?<!\$)\$(?!\$)(.+?)(?<!\$)\$(?!\$)')
+_RE_TEXT = re.compile(r'\\text\{([^}]*)\}')
+_RE_MATHBB = re.compile(r'\\mathbb\{([A-Z])\}')
+# \frac{a}{b}, one level of nested braces in each argument
+_RE_FRAC = re.compile(r'\\frac\{((?:[^{}]|\{[^{}]*\})*)\}\{((?:[^{}]|\{[^{}]*\})*)\}')
+# Every \command in one alternation:
+#   group 1: function names, whole words only (keeps \inf out of \infty)
+#   group 2: glyph names, longest first so \int wins over \in. Like a plain
+#            substring replace, a glyph name also matches as the prefix of a
+#            longer letter run (e.g. "\notinx" where $x$ directly followed
+#            \notin).
+_GLYPH_MAP = {cmd[1:]: glyph for cmd, glyph in LATEX_GLYPHS.items()}
+_FUNC_NAMES = frozenset(func[1:] for func in LATEX_FUNCTIONS)
+_RE_COMMANDS = re.compile(
+    r'\\(?:(' + '|'.join(sorted(_FUNC_NAMES)) + r')(?![a-zA-Z])'
+    r'|(' + '|'.join(sorted(_GLYPH_MAP, key=len, reverse=True)) + r'))'
+)
+# _{...} or _X (single char) or ^{...} or ^X (single char)
+_RE_SUBSUP = re.compile(r'([_^])\{([^}]*)\}|([_^])([^\s{}_^])')
+
+
+def _resolve_inline_math(m):
+    """Replace spaces inside $...$ with NBSP, then strip the $ delimiters."""
+    # Resolve LaTeX inside the math span first (already normalized in step 0)
+    inner = _resolve_latex_commands(m.group(1), _normalized=True)
+    # Replace regular spaces with non-breaking spaces
+    return inner.translate(_NBSP_TRANS)
+
+
+@functools.lru_cache(maxsize=4096)
 def resolve_latex(text):
     """
     Resolve LaTeX commands in text to Unicode.
@@ -382,24 +651,22 @@ def resolve_latex(text):
       5. \\frac{a}{b} -> a/b
       6. \\command -> Unicode glyph or function name
     """
+    # Most body text has no LaTeX at all
+    if "\\" not in text and "$" not in text:
+        return text
+
     # Step 0: Normalize double backslashes before LaTeX commands
-    text = re.sub(r'\\\\([a-zA-Z])', r'\\\1', text)
-
-    # Step 1: Process $...$ inline math spans
-    # Replace spaces inside $...$ with NBSP, then strip the $ delimiters
-    def resolve_inline_math(m):
-        inner = m.group(1)
-        # Resolve LaTeX inside the math span first
-        inner = _resolve_latex_commands(inner)
-        # Replace regular spaces with non-breaking spaces
-        inner = inner.replace(" ", NBSP)
-        return inner
-
-    # Process $...$ (but not $$...$$, which are already handled)
-    # Negative lookbehind/lookahead for $ to avoid matching $$
-    text = re.sub(r'(?<!\$)\$(?!\$)(.+?)(?<!\$)\$(?!\$)', resolve_inline_math, text)
-
-    # Also resolve any LaTeX commands outside of $...$ spans
+    if "\\\\" in text:
+        text = _RE_DBL_BS.sub(r'\\', text)
+
+    # Step 1: Process $...$ inline math spans (but not $$...$$, which are
+    # already handled). Skip the scan when no span can close.
+    if text.count("$") > 1:
+        text = _RE_INLINE_MATH.sub(_resolve_inline_math, text)
+
+    # Also resolve any LaTeX commands outside of $...$ spans. Step 0 already
+    # normalized, but a resolved span ending in "\\" can form a new
+    # "\\\\cmd" with its neighbour, so this pass still checks for doubles
     text = _resolve_latex_commands(text)
 
     return text
@@ -419,34 +686,41 @@ _MATHBB = {
 }
 
 
-def _resolve_latex_commands(text):
+def _command_replace(m):
+    func = m.group(1)
+    if func is not None:
+        return func  # upright function name, backslash dropped
+    return _GLYPH_MAP[m.group(2)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_latex_commands(text, _normalized=False):
     """Replace LaTeX commands with Unicode glyphs.
-    Handles both \\cmd and \\\\cmd (markdown often escapes backslashes)."""
+    Handles both \\cmd and \\\\cmd (markdown often escapes backslashes);
+    pass _normalized=True when the caller has already collapsed those."""
+    # Every pass below starts at a backslash
+    if "\\" not in text:
+        return text
+
     # Normalize double backslashes to single for LaTeX command matching
-    text = re.sub(r'\\\\([a-zA-Z])', r'\\\1', text)
+    # (a substring test is far cheaper than a regex pass that finds nothing)
+    if not _normalized and "\\\\" in text:
+        text = _RE_DBL_BS.sub(r'\\', text)
 
     # \text{...} -> content as-is
-    text = re.sub(r'\\text\{([^}]*)\}', r'\1', text)
+    text = _RE_TEXT.sub(r'\1', text)
 
     # \mathbb{X} -> double-struck character
     def mathbb_replace(m):
         char = m.group(1)
         return _MATHBB.get(char, char)
-    text = re.sub(r'\\mathbb\{([A-Z])\}', mathbb_replace, text)
+    text = _RE_MATHBB.sub(mathbb_replace, text)
 
     # \frac{a}{b} -> a/b (handles one level of nested braces)
-    text = re.sub(r'\\frac\{((?:[^{}]|\{[^{}]*\})*)\}\{((?:[^{}]|\{[^{}]*\})*)\}',
-                  r'(\1)/(\2)', text)
-
-    # Function names: \tanh -> tanh, \cosh -> cosh, etc.
-    # Use regex with word boundary to avoid \inf matching inside \infty
-    for func in LATEX_FUNCTIONS:
-        name = func[1:]  # strip backslash
-        text = re.sub(re.escape(func) + r'(?![a-zA-Z])', name, text)
+    text = _RE_FRAC.sub(r'(\1)/(\2)', text)
 
-    # Glyph substitutions (longest match first to avoid partial matches)
-    for cmd in sorted(LATEX_GLYPHS.keys(), key=len, reverse=True):
-        text = text.replace(cmd, LATEX_GLYPHS[cmd])
+    # Function names (\tanh -> tanh) and glyphs (\alpha -> α), one scan
+    text = _RE_COMMANDS.sub(_command_replace, text)
 
     return text
 
@@ -472,13 +746,14 @@ def parse_math_text(text, size=BODY_PT, bold=False, italic=False, font=FONT):
     runs = []
     base_props = {"size": size, "bold": bold, "italic": italic, "font": font}
 
-    # Pattern: match subscript/superscript notation
-    # _{...} or _X (single char) or ^{...} or ^X (single char)
-    # Single-char: any character that isn't whitespace, {, }, _, or ^
-    pattern = re.compile(r'([_^])\{([^}]*)\}|([_^])([^\s{}_^])')
+    # No sub/superscript markers: the whole text is one run
+    if "_" not in text and "^" not in text:
+        return [make_run(text, **base_props)]
 
+    # Subscript/superscript notation (_RE_SUBSUP)
+    # Single-char: any character that isn't whitespace, {, }, _, or ^
     pos = 0
-    for m in pattern.finditer(text):
+    for m in _RE_SUBSUP.finditer(text):
         # Add text before this match as normal run
         if m.start() > pos:
             preceding = text[pos:m.start()]
@@ -515,58 +790,53 @@ def make_paragraph(runs, align="justify", space_before=0, space_after=80,
                    keep_next=False, line_spacing=228, line_rule="auto",
                    tab_stops=None):
     """Create a paragraph element with formatting."""
+    _load_docx()
     p = OxmlElement("w:p")
-    pPr = OxmlElement("w:pPr")
+    pPr = SubElement(p, _Q_PPR)
 
     # OOXML schema requires specific element order in pPr:
-    # keepNext, spacing, ind, jc (among others)
+    # keepNext, spacing, ind, jc (among others). Each SubElement call
+    # creates and attaches in one step, so build them in that order.
 
     if keep_next:
-        pPr.append(OxmlElement("w:keepNext"))
+        SubElement(pPr, _Q_KEEP_NEXT)
 
     # Tab stops: list of (position_twips, alignment) tuples
     # alignment: "center", "end" (right), "start" (left)
     if tab_stops:
-        tabs = OxmlElement("w:tabs")
+        tabs = SubElement(pPr, _Q_TABS)
         for pos, align_type in tab_stops:
-            tab = OxmlElement("w:tab")
-            tab.set(qn("w:val"), align_type)
-            tab.set(qn("w:pos"), str(pos))
-            tabs.append(tab)
-        pPr.append(tabs)
+            tab = SubElement(tabs, _Q_TAB)
+            tab.set(_Q_VAL, align_type)
+            tab.set(_Q_POS, str(pos))
 
     # Spacing
-    spacing = OxmlElement("w:spacing")
-    spacing.set(qn("w:before"), str(space_before))
-    spacing.set(qn("w:after"), str(space_after))
+    spacing = SubElement(pPr, _Q_SPACING)
+    spacing.set(_Q_BEFORE, str(space_before))
+    spacing.set(_Q_AFTER, str(space_after))
     if line_spacing is not None:
-        spacing.set(qn("w:line"), str(line_spacing))
-        spacing.set(qn("w:lineRule"), line_rule)
-    pPr.append(spacing)
+        spacing.set(_Q_LINE, str(line_spacing))
+        spacing.set(_Q_LINE_RULE, line_rule)
 
     # Indentation
     if first_indent is not None or left_indent is not None or hanging is not None:
-        ind = OxmlElement("w:ind")
+        ind = SubElement(pPr, _Q_IND)
         if first_indent is not None and hanging is None:
-            ind.set(qn("w:firstLine"), str(first_indent))
+            ind.set(_Q_FIRST_LINE, str(first_indent))
         if left_indent is not None:
-            ind.set(qn("w:left"), str(left_indent))
+            ind.set(_Q_LEFT, str(left_indent))
         if hanging is not None:
-            ind.set(qn("w:hanging"), str(hanging))
-        pPr.append(ind)
+            ind.set(_Q_HANGING, str(hanging))
 
     # Alignment
-    jc = OxmlElement("w:jc")
+    jc = SubElement(pPr, _Q_JC)
     align_map = {
         "justify": "both",
         "center": "center",
         "left": "start",
         "right": "end",
     }
-    jc.set(qn("w:val"), align_map.get(align, "both"))
-    pPr.append(jc)
-
-    p.append(pPr)
+    jc.set(_Q_VAL, align_map.get(align, "both"))
 
     if isinstance(runs, list):
         for r in runs:
@@ -577,108 +847,42 @@ def make_paragraph(runs, align="justify", space_before=0, space_after=80,
     return p
 
 
-def inject_continuous_two_col_section_break(body, insert_before_element):
-    """
-    Insert a continuous section break with 2-column layout.
-    This is the key trick: python-docx can't create continuous section breaks,
-    so we build the XML directly and inject it into the paragraph preceding
-    the two-column content.
-    """
-    # We need to add a sectPr to the pPr of the paragraph BEFORE
-    # the two-column content starts. This tells Word:
-    # "end the current section here (single-column) and start a new
-    #  continuous section with 2 columns."
-
-    # Create a separator paragraph with the section properties
-    p = OxmlElement("w:p")
-    pPr = OxmlElement("w:pPr")
-
-    sectPr = OxmlElement("w:sectPr")
-
-    # Page size
-    pgSz = OxmlElement("w:pgSz")
-    pgSz.set(qn("w:w"), str(PAGE_W_TWIPS))
-    pgSz.set(qn("w:h"), str(PAGE_H_TWIPS))
-    sectPr.append(pgSz)
-
-    # Margins
-    pgMar = OxmlElement("w:pgMar")
-    pgMar.set(qn("w:top"), str(MARGIN_TOP_TWIPS))
-    pgMar.set(qn("w:right"), str(MARGIN_LR_TWIPS))
-    pgMar.set(qn("w:bottom"), str(MARGIN_BOTTOM_TWIPS))
-    pgMar.set(qn("w:left"), str(MARGIN_LR_TWIPS))
-    pgMar.set(qn("w:header"), "720")
-    pgMar.set(qn("w:footer"), "720")
-    pgMar.set(qn("w:gutter"), "0")
-    sectPr.append(pgMar)
-
-    # Single column for title section (no num attribute = 1 column)
-    cols = OxmlElement("w:cols")
-    cols.set(qn("w:space"), str(COL_SPACE_TWIPS))
-    cols.set(qn("w:num"), "1")
-    sectPr.append(cols)
-
-    # Document grid
-    docGrid = OxmlElement("w:docGrid")
-    docGrid.set(qn("w:linePitch"), "360")
-    sectPr.append(docGrid)
-
-    # NOTE: No w:type element here. Default = "nextPage" for the first section,
-    # but because the BODY section will have type=continuous, the body content
-    # will continue on the same page after the title.
+# Section properties are built from XML text: only the section type and the
+# column layout vary, page size and margins are always the same.
+_W_DECL = ' xmlns:w="%s"' % _W_NS[1:-1]
+_SECTPR_PAGE_XML = (
+    '<w:pgSz w:w="%d" w:h="%d"/>'
+    '<w:pgMar w:top="%d" w:right="%d" w:bottom="%d" w:left="%d"'
+    ' w:header="720" w:footer="720" w:gutter="0"/>'
+    % (PAGE_W_TWIPS, PAGE_H_TWIPS,
+       MARGIN_TOP_TWIPS, MARGIN_LR_TWIPS, MARGIN_BOTTOM_TWIPS, MARGIN_LR_TWIPS)
+)
 
-    pPr.append(sectPr)
-    p.append(pPr)
 
-    # Insert this paragraph before the target element
-    insert_before_element.addprevious(p)
+def _sectpr_xml(num_cols, col_space, continuous, nsdecl=""):
+    """
+    Return a w:sectPr as XML text, in OOXML schema order:
+    type, pgSz, pgMar, cols, docGrid.
+    """
+    sect_type = '<w:type w:val="continuous"/>' if continuous else ""
+    equal_width = ' w:equalWidth="1"' if num_cols > 1 else ""
+    return (
+        '<w:sectPr%s>%s%s<w:cols w:num="%d" w:space="%d"%s/>'
+        '<w:docGrid w:linePitch="360"/></w:sectPr>'
+        % (nsdecl, sect_type, _SECTPR_PAGE_XML, num_cols, col_space, equal_width)
+    )
 
 
-def inject_section_break(body, insert_before_element, num_cols=1,
-                         col_space=COL_SPACE_TWIPS, continuous=True):
+def _section_break_paragraph(num_cols, col_space, continuous):
     """
-    Insert a continuous (or next-page) section break before an element.
-    Used to transition between different column layouts (e.g., title -> author
-    columns -> body columns).
+    Empty paragraph whose pPr carries a sectPr, ending the current section.
+    Placed before the content of the next section to transition between
+    column layouts (e.g., title -> author columns -> body columns).
     """
-    p = OxmlElement("w:p")
-    pPr = OxmlElement("w:pPr")
-    sectPr = OxmlElement("w:sectPr")
-
-    if continuous:
-        sect_type = OxmlElement("w:type")
-        sect_type.set(qn("w:val"), "continuous")
-        sectPr.append(sect_type)
-
-    pgSz = OxmlElement("w:pgSz")
-    pgSz.set(qn("w:w"), str(PAGE_W_TWIPS))
-    pgSz.set(qn("w:h"), str(PAGE_H_TWIPS))
-    sectPr.append(pgSz)
-
-    pgMar = OxmlElement("w:pgMar")
-    pgMar.set(qn("w:top"), str(MARGIN_TOP_TWIPS))
-    pgMar.set(qn("w:right"), str(MARGIN_LR_TWIPS))
-    pgMar.set(qn("w:bottom"), str(MARGIN_BOTTOM_TWIPS))
-    pgMar.set(qn("w:left"), str(MARGIN_LR_TWIPS))
-    pgMar.set(qn("w:header"), "720")
-    pgMar.set(qn("w:footer"), "720")
-    pgMar.set(qn("w:gutter"), "0")
-    sectPr.append(pgMar)
-
-    cols = OxmlElement("w:cols")
-    cols.set(qn("w:num"), str(num_cols))
-    cols.set(qn("w:space"), str(col_space))
-    if num_cols > 1:
-        cols.set(qn("w:equalWidth"), "1")
-    sectPr.append(cols)
-
-    docGrid = OxmlElement("w:docGrid")
-    docGrid.set(qn("w:linePitch"), "360")
-    sectPr.append(docGrid)
-
-    pPr.append(sectPr)
-    p.append(pPr)
-    insert_before_element.addprevious(p)
+    return parse_xml(
+        '<w:p%s><w:pPr>%s</w:pPr></w:p>'
+        % (_W_DECL, _sectpr_xml(num_cols, col_space, continuous))
+    )
 
 
 def make_author_paragraph(author, size=AUTHOR_AFFIL_PT):
@@ -701,22 +905,12 @@ def make_author_paragraph(author, size=AUTHOR_AFFIL_PT):
     runs = []
 
     # Author name
-    runs.append(make_run(author["name"], size=size))
+    runs.append(make_run(author.name, size=size))
 
     # Affiliation lines separated by soft breaks
-    for line_text in author.get("lines", []):
+    for line_text in author.lines:
         # Soft line break
-        br_run = OxmlElement("w:r")
-        br_rPr = OxmlElement("w:rPr")
-        sz = OxmlElement("w:sz")
-        sz.set(qn("w:val"), str(size * 2))
-        br_rPr.append(sz)
-        szCs = OxmlElement("w:szCs")
-        szCs.set(qn("w:val"), str(size * 2))
-        br_rPr.append(szCs)
-        br_run.append(br_rPr)
-        br_run.append(OxmlElement("w:br"))
-        runs.append(br_run)
+        runs.append(_make_break_run(size))
 
         # Affiliation text (italic)
         runs.append(make_run(line_text, size=size, italic=True))
@@ -733,59 +927,52 @@ def set_final_section_two_col(doc):
     The document's last sectPr (direct child of w:body) controls the final section.
     We rebuild it cleanly to ensure correct element order per OOXML schema.
     """
+    _load_docx()
     body = doc.element.body
-    sectPr = body.find(qn("w:sectPr"))
+    sectPr = body.find(_Q_SECTPR)
 
     if sectPr is not None:
         body.remove(sectPr)
 
-    # Build fresh sectPr with correct element order:
-    # type, pgSz, pgMar, cols, docGrid
-    sectPr = OxmlElement("w:sectPr")
-
+    # Build fresh sectPr with correct element order (see _sectpr_xml).
     # type=continuous: body section continues on same page as title
-    sect_type = OxmlElement("w:type")
-    sect_type.set(qn("w:val"), "continuous")
-    sectPr.append(sect_type)
-
-    pgSz = OxmlElement("w:pgSz")
-    pgSz.set(qn("w:w"), str(PAGE_W_TWIPS))
-    pgSz.set(qn("w:h"), str(PAGE_H_TWIPS))
-    sectPr.append(pgSz)
-
-    pgMar = OxmlElement("w:pgMar")
-    pgMar.set(qn("w:top"), str(MARGIN_TOP_TWIPS))
-    pgMar.set(qn("w:right"), str(MARGIN_LR_TWIPS))
-    pgMar.set(qn("w:bottom"), str(MARGIN_BOTTOM_TWIPS))
-    pgMar.set(qn("w:left"), str(MARGIN_LR_TWIPS))
-    pgMar.set(qn("w:header"), "720")
-    pgMar.set(qn("w:footer"), "720")
-    pgMar.set(qn("w:gutter"), "0")
-    sectPr.append(pgMar)
-
-    cols = OxmlElement("w:cols")
-    cols.set(qn("w:num"), "2")
-    cols.set(qn("w:space"), str(COL_SPACE_TWIPS))
-    cols.set(qn("w:equalWidth"), "1")
-    sectPr.append(cols)
-
-    docGrid = OxmlElement("w:docGrid")
-    docGrid.set(qn("w:linePitch"), "360")
-    sectPr.append(docGrid)
+    sectPr = parse_xml(_sectpr_xml(2, COL_SPACE_TWIPS, continuous=True,
+                                   nsdecl=_W_DECL))
 
     # sectPr must be the LAST child of w:body
     body.append(sectPr)
 
 
-def build_document(parsed):
-    """Build the IEEE-formatted DOCX from parsed markdown."""
-    doc = Document()
+# Body paragraph patterns (build_document runs them once per paragraph)
+_RE_HEADING_PREFIX = re.compile(r"^[A-Za-z0-9]+\.\s*")  # "3. ", "IV. ", "B. "
+_RE_NUMLIST = re.compile(r"^(\d+)\.\s+\*\*(.+?)\*\*\s*(.*)")  # 1. **Label** rest
+_RE_BOLDLBL = re.compile(r"^\*\*(.+?)\*\*\s*(.*)")  # **Label:** rest
+_RE_BULLET = re.compile(r"^[-*]\s+")
 
+
+_BASE_DOCUMENT = None  # configured empty document, built on first use
+
+
+def new_document():
+    """
+    Return an empty Document with the IEEE styles and page setup applied.
+    The base is configured once per process; later calls deep-copy it,
+    which is cheaper than loading python-docx's default template again.
+    """
+    global _BASE_DOCUMENT
+    _load_docx()
+    if _BASE_DOCUMENT is None:
+        _BASE_DOCUMENT = _configure_document(Document())
+    return copy.deepcopy(_BASE_DOCUMENT)
+
+
+def _configure_document(doc):
+    """Apply the settings, default style and page setup every output shares."""
     # Fix zoom percent in settings (python-docx omits the required attribute)
     settings = doc.settings.element
-    zoom = settings.find(qn("w:zoom"))
-    if zoom is not None and zoom.get(qn("w:percent")) is None:
-        zoom.set(qn("w:percent"), "100")
+    zoom = settings.find(_Q_ZOOM)
+    if zoom is not None and zoom.get(_Q_PERCENT) is None:
+        zoom.set(_Q_PERCENT, "100")
 
     # Configure default style
     style = doc.styles["Normal"]
@@ -802,16 +989,27 @@ def build_document(parsed):
     section.left_margin = MARGIN_LR
     section.right_margin = MARGIN_LR
 
-    body = doc.element.body
-
     # Remove the default empty paragraph
-    for p in body.findall(qn("w:p")):
+    body = doc.element.body
+    for p in body.findall(_Q_P):
         body.remove(p)
 
+    return doc
+
+
+def build_document(parsed):
+    """Build the IEEE-formatted DOCX from parsed markdown."""
+    doc = new_document()
+    body = doc.element.body
+
+    # Paragraphs are collected in document order (section breaks included)
+    # and attached to the body with a single extend at the end
+    paragraphs = []
+
     # ---- SINGLE-COLUMN SECTION: Title ----
 
     # Title
-    body.append(make_paragraph(
+    paragraphs.append(make_paragraph(
         make_run(parsed["title"], size=TITLE_PT),
         align="center", space_after=120,
     ))
@@ -827,12 +1025,12 @@ def build_document(parsed):
     elif num_authors == 1:
         # Single author: keep simple centered layout (no multi-col needed)
         author = authors[0]
-        body.append(make_paragraph(
-            make_run(author["name"], size=AUTHOR_PT),
+        paragraphs.append(make_paragraph(
+            make_run(author.name, size=AUTHOR_PT),
             align="center", space_after=40,
         ))
-        for affil_line in author.get("lines", []):
-            body.append(make_paragraph(
+        for affil_line in author.lines:
+            paragraphs.append(make_paragraph(
                 make_run(affil_line, size=AFFIL_PT, italic=True),
                 align="center", space_after=40,
             ))
@@ -848,28 +1046,20 @@ def build_document(parsed):
             row_authors = authors[row_start:row_start + max_cols_per_row]
             ncols = len(row_authors)
 
-            # Build author paragraphs for this row
-            author_paras = []
-            for author in row_authors:
-                author_paras.append(make_author_paragraph(author))
-
-            # Append all author paragraphs to body
-            for ap in author_paras:
-                body.append(ap)
-
             # The first author paragraph of this row needs a section break
             # BEFORE it that starts the N-column section.
             # The last author paragraph needs the section properties embedded
             # in its pPr to END the N-column section.
 
-            # Inject section break before the first author para of this row:
+            # Section break before the first author para of this row:
             # transitions from previous section to N-col continuous
-            inject_section_break(
-                body, author_paras[0],
-                num_cols=ncols,
-                col_space=AUTHOR_COL_SPACE_TWIPS,
-                continuous=True,
-            )
+            paragraphs.append(_section_break_paragraph(
+                ncols, AUTHOR_COL_SPACE_TWIPS, continuous=True,
+            ))
+
+            # Then the author paragraphs for this row
+            for author in row_authors:
+                paragraphs.append(make_author_paragraph(author))
 
         # After all author rows, we need to end the last author section
         # and transition back. We'll handle this when we inject the
@@ -882,24 +1072,29 @@ def build_document(parsed):
     abstract_text = strip_markdown(" ".join(parsed["abstract"]))
     abstract_runs = [
         make_run("Abstract", size=ABSTRACT_PT, bold=True, italic=True),
-        make_run("\u2014", size=ABSTRACT_PT, bold=True),
+        make_run(_EM_DASH, size=ABSTRACT_PT, bold=True),
     ] + parse_math_text(abstract_text, size=ABSTRACT_PT, bold=True)
-    abstract_para = make_paragraph(
+
+    # Section break BEFORE abstract paragraph.
+    # This is the key trick: python-docx can't create continuous section
+    # breaks, so we build the XML directly. The separator paragraph ends the
+    # author section (single or multi-col) and starts the two-column body.
+    # NOTE: No w:type element here. Default = "nextPage" for the first section,
+    # but because the BODY section will have type=continuous, the body content
+    # will continue on the same page after the title.
+    paragraphs.append(_section_break_paragraph(1, COL_SPACE_TWIPS, continuous=False))
+
+    paragraphs.append(make_paragraph(
         abstract_runs,
         align="justify", space_before=360, space_after=200,
         first_indent=ABSTRACT_FIRST_INDENT,
-    )
-    body.append(abstract_para)
-
-    # Inject continuous section break BEFORE abstract paragraph
-    # This ends the author section (single or multi-col) and starts two-column body
-    inject_continuous_two_col_section_break(body, abstract_para)
+    ))
 
     # Keywords
     if parsed["keywords"]:
-        body.append(make_paragraph(
+        paragraphs.append(make_paragraph(
             [
-                make_run("Keywords" + chr(0x2014), size=KEYWORDS_PT, bold=True, italic=True),
+                make_run(_KEYWORDS_HEAD, size=KEYWORDS_PT, bold=True, italic=True),
                 make_run(parsed["keywords"], size=KEYWORDS_PT, bold=True, italic=True),
             ],
             align="justify", space_after=120,
@@ -909,49 +1104,49 @@ def build_document(parsed):
     # ---- Body sections ----
     equation_counter = 0
     for sec in parsed["sections"]:
-        if sec["level"] == 1:
-            heading = sec["heading"]
-            # Strip any existing numbering prefix (Arabic, Roman, etc.)
-            heading = re.sub(r"^[A-Za-z0-9]+\.\s*", "", heading)
-            display = to_roman(sec["number"]) + ". " + heading
+        if sec.level == 1:
+            heading = sec.heading
+            # Strip any existing numbering prefix (Arabic, Roman, etc.);
+            # a prefix always ends in ".", so most headings skip the regex
+            if "." in heading:
+                heading = _RE_HEADING_PREFIX.sub("", heading, count=1)
+            display = to_roman(sec.number) + ". " + heading
 
             # IEEE template: mixed case + small caps style (NOT .upper())
-            body.append(make_paragraph(
+            paragraphs.append(make_paragraph(
                 make_run(display, size=H1_PT, small_caps=True),
                 align="center", space_before=160, space_after=80,
                 keep_next=True,
             ))
 
-        elif sec["level"] == 2:
-            heading = sec["heading"]
-            heading = re.sub(r"^[A-Za-z0-9]+\.\s*", "", heading)
-            display = to_letter(sec["number"]) + ". " + heading
+        elif sec.level == 2:
+            heading = sec.heading
+            if "." in heading:
+                heading = _RE_HEADING_PREFIX.sub("", heading, count=1)
+            display = to_letter(sec.number) + ". " + heading
 
-            body.append(make_paragraph(
+            paragraphs.append(make_paragraph(
                 make_run(display, size=H2_PT, italic=True),
                 align="left", space_before=120, space_after=60,
                 keep_next=True,
             ))
 
         # Content paragraphs
-        for para_text in sec["content"]:
+        for para_text in sec.content:
             # Display equation: $$...$$ -> centered with right-justified number
             if isinstance(para_text, tuple) and para_text[0] == "equation":
                 eq_text = strip_markdown(para_text[1])
                 # Resolve LaTeX and replace spaces with non-breaking spaces
                 eq_text = resolve_latex(eq_text)
-                eq_text = eq_text.replace(" ", NBSP)
+                eq_text = eq_text.translate(_NBSP_TRANS)
                 equation_counter += 1
 
                 # Tab to center, equation, tab to right, (number)
-                tab1 = OxmlElement("w:r")
-                tab1.append(OxmlElement("w:tab"))
-
-                tab2 = OxmlElement("w:r")
-                tab2.append(OxmlElement("w:tab"))
+                tab1 = _make_tab_run()
+                tab2 = _make_tab_run()
 
                 # Column width = 5040 twips; center=2520, right=5040
-                body.append(make_paragraph(
+                paragraphs.append(make_paragraph(
                     [tab1]
                     + parse_math_text(eq_text, size=BODY_PT)
                     + [tab2, make_run("(" + str(equation_counter) + ")", size=BODY_PT)],
@@ -963,7 +1158,7 @@ def build_document(parsed):
             # Blockquote
             if isinstance(para_text, str) and para_text.startswith("> "):
                 quote = strip_markdown(para_text[2:])
-                body.append(make_paragraph(
+                paragraphs.append(make_paragraph(
                     parse_math_text(quote, size=BODY_PT, italic=True),
                     align="justify", space_after=120,
                     left_indent=int(Inches(0.2)),
@@ -971,11 +1166,14 @@ def build_document(parsed):
                 continue
 
             # Numbered list with bold label: "1. **Label** rest"
-            list_match = re.match(r"^(\d+)\.\s+\*\*(.+?)\*\*\s*(.*)", para_text)
+            # Only the leading character can make a paragraph a list item or
+            # a bold label, so check it before trying any regex
+            lead = para_text[:1]
+            list_match = lead.isdigit() and _RE_NUMLIST.match(para_text)
             if list_match:
                 num, label, rest = list_match.groups()
                 rest = strip_markdown(rest)
-                body.append(make_paragraph(
+                paragraphs.append(make_paragraph(
                     [
                         make_run(num + ". ", size=BODY_PT),
                         make_run(label + " ", size=BODY_PT, bold=True),
@@ -988,11 +1186,11 @@ def build_document(parsed):
                 continue
 
             # Bold label paragraph: "**Label:** rest"
-            bold_match = re.match(r"^\*\*(.+?)\*\*\s*(.*)", para_text)
+            bold_match = lead == "*" and _RE_BOLDLBL.match(para_text)
             if bold_match and bold_match.group(2):
                 label, rest = bold_match.groups()
                 rest = strip_markdown(rest)
-                body.append(make_paragraph(
+                paragraphs.append(make_paragraph(
                     [make_run(label + " ", size=BODY_PT, bold=True)]
                     + parse_math_text(rest, size=BODY_PT),
                     align="justify", space_after=120,
@@ -1002,33 +1200,15 @@ def build_document(parsed):
 
             # Bullet list item
             # Bullet hangs left; tab pushes text to indent position
-            if re.match(r"^[-*]\s", para_text):
-                item = strip_markdown(re.sub(r"^[-*]\s+", "", para_text))
-
-                # Build bullet run with tab
-                bullet_run = OxmlElement("w:r")
-                bRPr = OxmlElement("w:rPr")
-                brf = OxmlElement("w:rFonts")
-                brf.set(qn("w:ascii"), FONT)
-                brf.set(qn("w:hAnsi"), FONT)
-                brf.set(qn("w:cs"), FONT)
-                bRPr.append(brf)
-                bsz = OxmlElement("w:sz")
-                bsz.set(qn("w:val"), str(BODY_PT * 2))
-                bRPr.append(bsz)
-                bszCs = OxmlElement("w:szCs")
-                bszCs.set(qn("w:val"), str(BODY_PT * 2))
-                bRPr.append(bszCs)
-                bullet_run.append(bRPr)
-                bt = OxmlElement("w:t")
-                bt.text = "\u2022"
-                bullet_run.append(bt)
-
-                # Tab run
-                tab_run = OxmlElement("w:r")
-                tab_run.append(OxmlElement("w:tab"))
-
-                body.append(make_paragraph(
+            bullet_match = (lead == "-" or lead == "*") and _RE_BULLET.match(para_text)
+            if bullet_match:
+                item = strip_markdown(para_text[bullet_match.end():])
+
+                # Bullet run, then a tab to the text indent
+                bullet_run = make_run("\u2022", size=BODY_PT)
+                tab_run = _make_tab_run()
+
+                paragraphs.append(make_paragraph(
                     [bullet_run, tab_run]
                     + parse_math_text(item, size=BODY_PT),
                     align="justify", space_after=40,
@@ -1042,7 +1222,7 @@ def build_document(parsed):
             cleaned = strip_markdown(para_text)
             if not cleaned.strip():
                 continue
-            body.append(make_paragraph(
+            paragraphs.append(make_paragraph(
                 parse_math_text(cleaned, size=BODY_PT),
                 align="justify", space_after=120,
                 first_indent=BODY_FIRST_INDENT,
@@ -1050,14 +1230,14 @@ def build_document(parsed):
             ))
 
     # ---- References ----
-    body.append(make_paragraph(
+    paragraphs.append(make_paragraph(
         make_run("References", size=H1_PT, small_caps=True),
         align="center", space_before=200, space_after=80,
     ))
 
+    # Reference text comes from the parser with markdown already stripped
     for i, ref_text in enumerate(parsed["references"]):
-        ref_text = strip_markdown(ref_text)
-        body.append(make_paragraph(
+        paragraphs.append(make_paragraph(
             [
                 make_run("[" + str(i + 1) + "]" + NBSP, size=REF_PT),
                 make_run(ref_text, size=REF_PT),
@@ -1068,6 +1248,9 @@ def build_document(parsed):
             line_spacing=180, line_rule="exact",  # 9pt exact
         ))
 
+    # Attach everything to the body in one go
+    body.extend(paragraphs)
+
     # Set the final document section to two-column
     set_final_section_two_col(doc)
 
@@ -1078,51 +1261,142 @@ def build_document(parsed):
 # Main
 # ============================================================================
 
-def main():
-    # Get input file path
-    if len(sys.argv) > 1:
-        input_path = sys.argv[1]
-    else:
-        input_path = input("Enter path to markdown file: ").strip().strip('"').strip("'")
+# Output file flags: O_BINARY keeps Windows from translating newlines at the
+# descriptor level, and O_SEQUENTIAL hints sequential access to its cache
+# manager. Both are 0 (absent) elsewhere.
+_OUTPUT_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                 | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0))
+
+# Input suffixes accepted without a warning (case variants spelled out)
+_MD_SUFFIXES = frozenset({".md", ".MD", ".Md", ".mD", ".markdown", ".MARKDOWN"})
+
+
+def _read_text(path, size):
+    """
+    Read a UTF-8 text file whose size is already known from a stat, into a
+    buffer allocated once at that size.
+    """
+    buf = bytearray(size)
+    with open(path, "rb", buffering=0) as f:
+        n = f.readinto(buf)
+        rest = f.read()  # normally b"": only if the file grew since the stat
+    if n < size:
+        del buf[n:]
+    text = (buf + rest if rest else buf).decode("utf-8")
+    # Universal newlines, as a text-mode open() would have given
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _interactive():
+    """True when stdin is a terminal, i.e. prompts and pauses can be answered."""
+    return sys.stdin is not None and sys.stdin.isatty()
+
 
-    input_path = Path(input_path).expanduser().resolve()
+def convert_file(input_path):
+    """
+    Convert one markdown file to <stem>_IEEE.docx next to it, printing
+    progress. Returns False if the input file doesn't exist.
+    """
+    # No resolve(): only the file name matters for the output path. One
+    # stat checks existence and supplies the size the read buffer needs.
+    input_path = Path(input_path).expanduser()
 
-    if not input_path.exists():
+    try:
+        st = os.stat(input_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         print(f"Error: File not found: {input_path}")
-        sys.exit(1)
+        return False
 
-    if not input_path.suffix.lower() == ".md":
+    if input_path.suffix not in _MD_SUFFIXES:
         print(f"Warning: Expected .md file, got {input_path.suffix}")
 
     # Output path: same directory, same stem, _IEEE.docx
     output_path = input_path.with_name(input_path.stem + "_IEEE.docx")
-
-    print(f"Input:  {input_path}")
-    print(f"Output: {output_path}")
-    print()
+    # Convert each path to str once: the banner, open() and the final
+    # message all use the same string
+    in_s = str(input_path)
+    out_s = str(output_path)
+
+    # Status lines go out in one write per block rather than one per line
+    sys.stdout.write(
+        f"Input:  {in_s}\n"
+        f"Output: {out_s}\n"
+        "\n"
+        "Parsing markdown...\n"
+    )
 
     # Parse
-    print("Parsing markdown...")
-    parsed = parse_markdown(str(input_path))
-    print(f"  Title:      {parsed['title'][:60]}...")
-    print(f"  Authors:    {len(parsed['authors'])}")
+    parsed = parse_markdown_str(_read_text(input_path, st.st_size))
+    lines = [
+        f"  Title:      {parsed['title'][:60]}...",
+        f"  Authors:    {len(parsed['authors'])}",
+    ]
     for a in parsed["authors"]:
-        print(f"              {a['name']} ({len(a['lines'])} affil lines)")
-    print(f"  Abstract:   {len(parsed['abstract'])} paragraph(s)")
-    print(f"  Sections:   {len(parsed['sections'])}")
-    print(f"  References: {len(parsed['references'])}")
-    print()
+        lines.append(f"              {a.name} ({len(a.lines)} affil lines)")
+    lines += [
+        f"  Abstract:   {len(parsed['abstract'])} paragraph(s)",
+        f"  Sections:   {len(parsed['sections'])}",
+        f"  References: {len(parsed['references'])}",
+        "",
+        "Building IEEE document...",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Build
-    print("Building IEEE document...")
     doc = build_document(parsed)
 
-    # Save
-    doc.save(str(output_path))
-    print(f"Saved: {output_path}")
+    # Save: zip into memory, then hand the file to the OS in one write
+    buf = io.BytesIO()
+    doc.save(buf)
+    with os.fdopen(os.open(out_s, _OUTPUT_FLAGS, 0o666), "wb") as f:
+        f.write(buf.getbuffer())
+    print(f"Saved: {out_s}")
+    return True
+
+
+def main():
+    # Get input file paths; several can be given to convert them in one
+    # process, paying the python-docx import only once
+    if len(sys.argv) > 1:
+        input_paths = sys.argv[1:]
+    elif _interactive():
+        input_paths = [input("Enter path to markdown file: ").strip().strip('"').strip("'")]
+    else:
+        print("Usage: python ieee_md2docx.py paper.md [more.md ...]")
+        sys.exit(2)
+
+    # One bad file (missing, not UTF-8, ...) is reported and counted, and the
+    # rest of the batch still runs. A missing python-docx would fail every
+    # file, so that still goes straight to the handler below.
+    failed = 0
+    for i, input_path in enumerate(input_paths):
+        if i:
+            print()
+        try:
+            ok = convert_file(input_path)
+        except ImportError:
+            raise
+        except Exception as e:
+            # Same report as the handler below: traceback, then summary
+            traceback.print_exc()
+            print()
+            print(f"Error: {input_path}: {e}")
+            ok = False
+        if not ok:
+            failed += 1
+
+    if failed:
+        # Keep a double-clicked console open so the errors can be read
+        if _interactive():
+            input("\nPress Enter to exit...")
+        sys.exit(1)
 
     # Pause if double-clicked (no args)
-    if len(sys.argv) <= 1:
+    if len(sys.argv) <= 1 and _interactive():
         input("\nPress Enter to exit...")
 
 
@@ -1134,9 +1408,15 @@ if __name__ == "__main__":
         print()
         print("Install with:  pip install python-docx")
         print()
-        input("Press Enter to exit...")
+        if _interactive():
+            input("Press Enter to exit...")
+        sys.exit(2)
     except Exception as e:
+        # Traceback first, so the summary is the last thing on screen
+        traceback.print_exc()
+        print()
         print(f"Error: {e}")
         print()
-        input("Press Enter to exit...")
-        raise
+        if _interactive():
+            input("Press Enter to exit...")
+        sys.exit(1)